@@ -1,11 +1,18 @@
-import os, sys, json, datetime as dt
-import feedparser, requests, yaml
-from bs4 import BeautifulSoup
-from readability import Document
-import trafilatura
+import os, re, sys, json, time, random, shutil, hashlib, threading, multiprocessing, datetime as dt
+import numpy as np
+import requests, yaml
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
 from email.utils import format_datetime
+from html import escape
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import wraps
+from itertools import islice
 from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
 from zoneinfo import ZoneInfo  # stdlib tz support
 
 # ---------- Config ----------
@@ -15,36 +22,191 @@ PUBLIC_BASE_URL = os.getenv("PUBLIC_BASE_URL", "").strip()
 OPENAI_API_KEY  = os.getenv("OPENAI_API_KEY", "").strip()
 OPENAI_MODEL    = os.getenv("OPENAI_MODEL", "gpt-4o").strip()   # your secret overrides this
 MAX_ITEMS       = int(os.getenv("MAX_ITEMS", "12"))
+USE_BATCH       = os.getenv("USE_BATCH", "").strip() == "1"   # draft via the (cheaper, slower) Batch API
+BATCH_POLL_SECS = int(os.getenv("BATCH_POLL_SECS", "30"))
+BATCH_MAX_WAIT  = int(os.getenv("BATCH_MAX_WAIT", "2400"))    # give up before the next hourly run starts
+EXTRACT_TTL     = int(os.getenv("EXTRACT_TTL", str(24 * 3600)))   # seconds extracted text stays fresh on disk
+NO_EXTRACT_CACHE = os.getenv("NO_EXTRACT_CACHE", "").strip() == "1"  # always re-fetch articles
+FEED_WORKERS    = int(os.getenv("FEED_WORKERS", "8"))     # concurrent RSS downloads
+FETCH_WORKERS   = int(os.getenv("FETCH_WORKERS", "8"))    # concurrent article downloads
+MAX_HTML_BYTES  = int(os.getenv("MAX_HTML_BYTES", str(1024 * 1024)))   # article pages are cut off here
+EXTRACT_PROCS   = int(os.getenv("EXTRACT_PROCS", str(os.cpu_count() or 1)))   # article parsing processes
+EXTRACT_POOL_MIN = int(os.getenv("EXTRACT_POOL_MIN", "8"))   # smaller batches are parsed in-process
+NOTES_TOKEN_BUDGET = int(os.getenv("NOTES_TOKEN_BUDGET", "1500"))   # cap on story notes sent to GPT
+TTS_WORKERS     = int(os.getenv("TTS_WORKERS", "3"))      # concurrent ElevenLabs requests
+TTS_MIN_CHARS   = 400         # paragraphs are merged until a TTS segment is at least this long
 
 PUBLIC_DIR = Path("public")
 EP_DIR     = PUBLIC_DIR / "episodes"
 SH_NOTES   = PUBLIC_DIR / "shownotes"
 DEBUG_DIR  = PUBLIC_DIR / "debug"
-for d in (PUBLIC_DIR, EP_DIR, SH_NOTES, DEBUG_DIR):
+CACHE_DIR  = Path(".cache")           # run-to-run state; kept out of PUBLIC_DIR so it is never published
+FEED_STATE = CACHE_DIR / "feed_state.json"   # etag/modified + last entries per feed
+DRAFT_CACHE = CACHE_DIR / "openai"           # finished scripts keyed by request hash
+DOMAIN_STATS = CACHE_DIR / "domain_stats.json"   # per-host trafilatura ok/fail counts
+SHOWNOTES_SIG = CACHE_DIR / "shownotes.sig"      # hash of the last shownotes page written
+for d in (PUBLIC_DIR, EP_DIR, SH_NOTES, DEBUG_DIR, CACHE_DIR, DRAFT_CACHE):
     d.mkdir(parents=True, exist_ok=True)
 
+def _prune_cache():
+    """Delete cached article text and drafts older than EXTRACT_TTL (they'd never be read again)."""
+    cutoff = time.time() - EXTRACT_TTL
+    for d in (CACHE_DIR, DRAFT_CACHE):
+        for path in (*d.glob("*.txt"), *d.glob("*.tmp")):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
+
+_prune_cache()
+
+# ---------- HTTP ----------
+# One pooled session for every HTTP call so repeat hosts reuse TCP/TLS connections.
+SESSION = requests.Session()
+SESSION.headers["User-Agent"] = "Mozilla/5.0"
+# urllib3 lists br/zstd here only when their decoders (`brotli`, its zstd extra) are installed
+SESSION.headers["Accept-Encoding"] = ACCEPT_ENCODING
+# Quick transport-level retries for feed/article GETs.
+_adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                                         max_retries=Retry(total=2, backoff_factor=0.3))
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+# urllib3 retries connect errors for any method, POST included, so the ElevenLabs host
+# gets an adapter without them; its calls are retried only by with_backoff below.
+SESSION.mount("https://api.elevenlabs.io/",
+              requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=16, max_retries=0))
+
+RETRY_ATTEMPTS = 4
+RETRY_MAX_WAIT = 30   # seconds
+# network-level failures worth retrying
+_TRANSIENT_ERRORS = (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)
+
+def _is_transient(exc: Exception) -> bool:
+    if isinstance(exc, _TRANSIENT_ERRORS):
+        return True
+    # the OpenAI SDK is imported lazily, so only look for its errors once it is loaded
+    openai = sys.modules.get("openai")
+    if openai and isinstance(exc, openai.APIConnectionError):
+        return True
+    # a stream that breaks mid-read surfaces the SDK's HTTP client error unwrapped
+    for name in ("httpx", "httpx2"):
+        mod = sys.modules.get(name)
+        if mod and isinstance(exc, getattr(mod, "TransportError", ())):
+            return True
+    return False
+
+def _retry_delay(exc: Exception, attempt: int) -> float | None:
+    """Seconds to wait before retrying `exc`, or None if it should not be retried."""
+    resp = getattr(exc, "response", None)
+    status = getattr(resp, "status_code", None)
+    if status is not None:
+        if status != 429 and status < 500:
+            return None
+        retry_after = resp.headers.get("retry-after")
+        if retry_after:
+            try:
+                return min(float(retry_after), RETRY_MAX_WAIT)
+            except ValueError:
+                pass
+    elif not _is_transient(exc):
+        return None
+    return random.uniform(0, min(RETRY_MAX_WAIT, 2 ** attempt))   # exponential backoff, full jitter
+
+def with_backoff(fn):
+    """Retry `fn` on 429/5xx and connection errors, honoring Retry-After."""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        for attempt in range(RETRY_ATTEMPTS):
+            try:
+                return fn(*args, **kwargs)
+            except Exception as exc:
+                delay = _retry_delay(exc, attempt)
+                if delay is None or attempt == RETRY_ATTEMPTS - 1:
+                    raise
+                print(f"[warn] {fn.__name__} failed ({exc}); retry in {delay:.1f}s", file=sys.stderr)
+                time.sleep(delay)
+    return wrapper
+
 # ---------- Load feeds ----------
+try:
+    from yaml import CSafeLoader as _YamlLoader   # libyaml-backed when PyYAML was built with it
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 with open("feeds.yml", "r", encoding="utf-8") as f:
-    feeds_cfg = yaml.safe_load(f) or {}
+    feeds_cfg = yaml.load(f, Loader=_YamlLoader) or {}
 SOURCES    = feeds_cfg.get("sources", [])
 EXCLUDE    = set(str(k).lower() for k in feeds_cfg.get("exclude_keywords", []))
 LIMIT_PER  = int(feeds_cfg.get("daily_limit_per_source", 6))
+# all exclude keywords in one alternation, so each title is scanned once
+_EXCLUDE_RE = re.compile("|".join(re.escape(k) for k in sorted(EXCLUDE))) if EXCLUDE else None
+# `article_urls` regexes (listed under any source, matched against every link): links that
+# match are never treated as list pages. A bad pattern is reported and ignored.
+_ARTICLE_URL_RES = []
+for _src in SOURCES:
+    for _pat in _src.get("article_urls") or []:
+        try:
+            _ARTICLE_URL_RES.append(re.compile(_pat))
+        except (re.error, TypeError) as ex:
+            print(f"[warn] bad article_urls pattern {_pat!r} ({_src.get('name','Unknown')}): {ex}",
+                  file=sys.stderr)
 
 # ---------- Helpers ----------
+# feedparser, trafilatura, readability and lxml are imported inside the functions that
+# use them, so startup doesn't pay for parsers a run may never reach.
 def is_newsworthy(title: str) -> bool:
     t = (title or "").lower()
-    return t and not any(k in t for k in EXCLUDE)
+    return bool(t) and not (_EXCLUDE_RE and _EXCLUDE_RE.search(t))
+
+def _load_feed_state() -> dict:
+    try:
+        return json.loads(FEED_STATE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+def _parse_one(src, state):
+    """Fetch one feed, sending last run's etag/modified so unchanged feeds answer 304."""
+    import feedparser
+    name, rss = src.get("name","Unknown"), src.get("rss","")
+    if not rss:
+        return name, rss, None
+    prev = state.get(rss, {})
+    headers = {}
+    if "entries" in prev:   # only ask for a 304 when we have entries to fall back on
+        if prev.get("etag"):
+            headers["If-None-Match"] = prev["etag"]
+        if prev.get("modified"):
+            headers["If-Modified-Since"] = prev["modified"]
+    try:
+        # download on the shared session (pooled connections), parse the bytes locally
+        r = SESSION.get(rss, headers=headers, timeout=20)
+        if r.status_code == 304 and "entries" in prev:
+            return name, rss, prev   # not modified: reuse the entries we saved last time
+        r.raise_for_status()
+        # only title/link are read, so skip feedparser's HTML sanitizing and URI rewriting
+        fp = feedparser.parse(r.content, sanitize_html=False, resolve_relative_uris=False,
+                              response_headers={"content-type": r.headers.get("Content-Type", ""),
+                                                "content-location": r.url})
+    except Exception as ex:
+        print(f"[warn] feed error {name}: {ex}", file=sys.stderr)
+        return name, rss, None
+    entries = [{"title": e.get("title") or "", "link": e.get("link") or ""} for e in fp.entries]
+    return name, rss, {"etag": r.headers.get("ETag"), "modified": r.headers.get("Last-Modified"),
+                       "entries": entries}
 
 def fetch_items():
     items = []
-    for src in SOURCES:
-        name, rss = src.get("name","Unknown"), src.get("rss","")
-        if not rss:
-            continue
-        try:
-            fp = feedparser.parse(rss)
+    if not SOURCES:
+        return items
+    state = _load_feed_state()
+    # Feeds are independent, so download them concurrently; map() keeps source order.
+    with ThreadPoolExecutor(max_workers=max(1, min(FEED_WORKERS, len(SOURCES)))) as ex:
+        for name, rss, feed in ex.map(lambda src: _parse_one(src, state), SOURCES):
+            if feed is None:
+                continue
+            state[rss] = feed
             count = 0
-            for e in fp.entries:
+            for e in feed["entries"]:
                 if count >= LIMIT_PER: break
                 title = (e.get("title") or "").strip()
                 link  = (e.get("link") or "").strip()
@@ -52,66 +214,250 @@ def fetch_items():
                 if not is_newsworthy(title): continue
                 items.append({"source": name, "title": title, "link": link})
                 count += 1
-        except Exception as ex:
-            print(f"[warn] feed error {name}: {ex}", file=sys.stderr)
+    try:
+        _write_atomic(FEED_STATE, json.dumps(state))
+    except OSError as ex:
+        print(f"[warn] feed state write failed: {ex}", file=sys.stderr)
     return items
 
 def dedupe(items, threshold=90):
-    kept, seen = [], []
-    for it in items:
-        title = it["title"]
-        if not seen:
-            kept.append(it); seen.append(title); continue
-        match = process.extractOne(title, seen, scorer=fuzz.token_set_ratio)
-        if not match or match[1] < threshold:
-            kept.append(it); seen.append(title)
-    return kept
-
-def extract_text(url: str) -> str:
-    # 1) trafilatura
-    try:
-        downloaded = trafilatura.fetch_url(url, timeout=20)
-        if downloaded:
-            extracted = trafilatura.extract(downloaded, include_comments=False, include_tables=False)
-            if extracted and len(extracted.split()) > 40:
-                return extracted
+    """Drop near-duplicate headlines, keeping the first occurrence."""
+    if not items:
+        return []
+    # Normalize (lowercase, strip punctuation) once per title instead of per comparison.
+    titles = [default_process(it["title"]) for it in items]
+    # One similarity matrix computed in C; scores under the threshold come back as 0.
+    scores = process.cdist(titles, titles, scorer=fuzz.token_set_ratio, processor=None,
+                           score_cutoff=threshold, workers=-1, dtype=np.uint8)
+    kept_idx = []
+    for i in range(len(items)):
+        if not (scores[i, kept_idx] >= threshold).any():
+            kept_idx.append(i)
+    return [items[i] for i in kept_idx]
+
+def canon_url(url: str) -> str:
+    """Drop utm_* tracking params and the fragment so cross-posted links compare equal."""
+    p = urlsplit(url)
+    # filter the raw "k=v" pieces rather than re-encoding, so every other param stays byte-for-byte
+    query = "&".join(q for q in p.query.split("&") if not q.lower().startswith("utm_"))
+    return urlunsplit((p.scheme, p.netloc, p.path, query, ""))
+
+def fetch_html(url: str) -> str | bytes:
+    """Download a page once; both extractors below work off the same HTML.
+    Without a declared charset the raw bytes are returned so trafilatura sniffs the
+    encoding itself (cchardet when installed) instead of requests' slower fallback."""
+    try:
+        # stream so oversized pages (inline JSON blobs, endless comment threads) stop
+        # downloading, and stop costing parse time, once the article body is long past
+        with SESSION.get(url, timeout=20, stream=True) as r:
+            r.raise_for_status()
+            buf = bytearray()
+            for chunk in r.iter_content(64 * 1024):
+                buf += chunk
+                if len(buf) >= MAX_HTML_BYTES:
+                    break
+        data = bytes(buf[:MAX_HTML_BYTES])
+        if "charset" in r.headers.get("Content-Type", "").lower():
+            try:
+                return data.decode(r.encoding, errors="replace")
+            except (LookupError, TypeError):
+                pass   # empty or unknown charset label: let trafilatura sniff the bytes
+        return data
+    except Exception:
+        return ""
+
+def _trafilatura_text(html: str | bytes, url: str) -> str:
+    import trafilatura
+    try:
+        # favor_precision: bail out sooner on pages that aren't really articles
+        extracted = trafilatura.extract(html, url=url, include_comments=False, include_tables=False,
+                                        favor_precision=True)
+        if extracted and len(extracted.split()) > 40:
+            return extracted
     except Exception:
         pass
-    # 2) readability
+    return ""
+
+def _readability_text(html: str | bytes) -> str:
+    from lxml import html as lxml_html
+    from readability import Document
     try:
-        html = requests.get(url, timeout=20, headers={"User-Agent":"Mozilla/5.0"}).text
         doc = Document(html)
         cleaned = doc.summary()
-        text = BeautifulSoup(cleaned, "html.parser").get_text("\n")
+        text = "\n".join(lxml_html.fromstring(cleaned).itertext())
         lines = [l.strip() for l in text.splitlines() if l.strip()]
         lines = [l for l in lines if len(l.split()) > 4]
         return "\n".join(lines)
     except Exception:
         return ""
 
+# <meta property|name="og:type" content="...">, attributes in either order, quoted or not
+_OG_TYPE_RE = re.compile(r"""<meta\b(?=[^>]*\b(?:property|name)\s*=\s*["']?og:type\b)"""
+                         r"""[^>]*\bcontent\s*=\s*["']?([^"'\s>]+)""", re.I)
+# section/index paths: the site root, or /topic/, /tag/, /section/, /category/, /author/ ...
+_LIST_PATH_RE = re.compile(r"^/?$|/(?:topics?|tags?|sections?|category|categories|authors?|search)(?:/|$)", re.I)
+
+def _is_list_page(html: str | bytes, url: str) -> bool:
+    """True only on a positive signal (og:type=website or a section-style path);
+    anything ambiguous is treated as an article, since feed links nearly always are."""
+    if any(r.search(url) for r in _ARTICLE_URL_RES):
+        return False
+    if _LIST_PATH_RE.search(urlsplit(url).path):
+        return True
+    if isinstance(html, bytes):
+        html = html.decode("latin-1")   # the tag is ASCII; any 1:1 decoding will do
+    m = _OG_TYPE_RE.search(html)
+    return bool(m) and m.group(1).lower() == "website"
+
+def _extract(html: str | bytes, url: str, trafilatura_first: bool = True) -> tuple[str, bool | None]:
+    """Returns (text, trafilatura succeeded?) — the flag is None when trafilatura didn't run."""
+    if not html:
+        return "", None
+    if _is_list_page(html, url):
+        return "", None   # trafilatura would glue teasers together; skip both parsers
+    if trafilatura_first:
+        text = _trafilatura_text(html, url)
+        if text:
+            return text, True
+        return _readability_text(html), False
+    # hosts where trafilatura keeps failing: readability first, trafilatura as a last resort
+    text = _readability_text(html)
+    if text:
+        return text, None
+    text = _trafilatura_text(html, url)
+    return text, bool(text)
+
+def _load_domain_stats() -> dict:
+    try:
+        return json.loads(DOMAIN_STATS.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+def _trafilatura_unreliable(s: dict) -> bool:
+    tried = s["ok"] + s["fail"]
+    return tried >= 3 and s["fail"] / tried > 0.7
+
+def _write_atomic(path: Path, text: str):
+    tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    tmp.write_text(text, encoding="utf-8", newline="")   # stored exactly as given, on every OS
+    os.replace(tmp, path)
+
+def _cache_path(url: str) -> Path:
+    return CACHE_DIR / f"{hashlib.sha256(url.encode()).hexdigest()}.txt"
+
+def _read_cache(url: str) -> str | None:
+    """Extracted text younger than EXTRACT_TTL, or None on a miss."""
+    if NO_EXTRACT_CACHE:
+        return None
+    path = _cache_path(url)
+    try:
+        if time.time() - path.stat().st_mtime < EXTRACT_TTL:
+            return path.read_text(encoding="utf-8")
+    except OSError:
+        pass
+    return None
+
+def _store_cache(url: str, text: str):
+    if not text:
+        return   # don't pin a transient failure for a whole day
+    try:
+        _write_atomic(_cache_path(url), text)
+    except OSError as ex:
+        print(f"[warn] cache write failed {url}: {ex}", file=sys.stderr)
+
+def extract_many(urls: list[str]) -> list[str]:
+    """Article text for each URL, reusing fresh on-disk copies; downloads overlap on
+    threads, parsing runs on processes.
+
+    trafilatura/readability are mostly Python-level work that holds the GIL, so
+    threads alone serialize the parsing; a process pool spreads it across cores.
+    """
+    texts = [_read_cache(u) for u in urls]
+    misses = [i for i, t in enumerate(texts) if t is None]
+    if not misses:
+        return texts
+    miss_urls = [urls[i] for i in misses]
+    with ThreadPoolExecutor(max_workers=max(1, min(FETCH_WORKERS, len(miss_urls)))) as ex:
+        htmls = list(ex.map(fetch_html, miss_urls))
+    stats = _load_domain_stats()
+    hosts = [urlsplit(u).netloc for u in miss_urls]
+    order = []   # per URL: try trafilatura first?
+    for host in hosts:
+        s = stats.setdefault(host, {"ok": 0, "fail": 0, "skips": 0})
+        if _trafilatura_unreliable(s):
+            s["skips"] += 1
+            order.append(s["skips"] % 10 == 0)   # re-probe now and then in case the site changed
+        else:
+            order.append(True)
+    results = None
+    procs = min(EXTRACT_PROCS, len(miss_urls))
+    if procs > 1 and len(miss_urls) >= EXTRACT_POOL_MIN:
+        # import the parsers here and fork, so workers inherit them instead of each
+        # paying the import again for a couple of pages apiece
+        import trafilatura, readability, lxml.html   # noqa: F401
+        fork = "fork" in multiprocessing.get_all_start_methods()
+        try:
+            with ProcessPoolExecutor(max_workers=procs,
+                                     mp_context=multiprocessing.get_context("fork") if fork else None) as pp:
+                results = list(pp.map(_extract, htmls, miss_urls, order))
+        except (OSError, BrokenProcessPool) as ex:
+            print(f"[warn] process pool unavailable, extracting in-process: {ex}", file=sys.stderr)
+    if results is None:
+        results = list(map(_extract, htmls, miss_urls, order))
+    fresh = [text for text, _ in results]
+    for host, (_, traf_ok) in zip(hosts, results):
+        s = stats[host]
+        if traf_ok and _trafilatura_unreliable(s):
+            s.update(ok=1, fail=0, skips=0)   # a probe worked again: start over
+        elif traf_ok is not None:
+            s["ok" if traf_ok else "fail"] += 1
+    try:
+        _write_atomic(DOMAIN_STATS, json.dumps(stats))
+    except OSError as ex:
+        print(f"[warn] domain stats write failed: {ex}", file=sys.stderr)
+    for i, url, text in zip(misses, miss_urls, fresh):
+        _store_cache(url, text)
+        texts[i] = text
+    return texts
+
+_SENT_RE = re.compile(r"\. |\? |! | — | – | • |… ")
+
 def first_sentence(text: str) -> str:
     text = " ".join(text.split())
-    for sep in [". ", " — ", " – ", " • "]:
-        if sep in text:
-            cand = text.split(sep)[0]
-            if len(cand.split()) >= 8:
-                return cand.strip(".•–— ")
+    # first separator that leaves a lead of 8+ words (text is single-spaced now)
+    for m in _SENT_RE.finditer(text):
+        if text.count(" ", 0, m.start()) >= 7:
+            return text[:m.start()].strip(".•–— ")
     return text[:240].rsplit(" ",1)[0]
 
 def build_notes(items):
-    """Short factual notes with attribution + link. GPT will rewrite naturally."""
-    notes = []
-    used = 0
+    """Short factual notes, one "Source: lead" line each. GPT will rewrite naturally."""
+    # Articles are fetched and parsed in parallel; results come back in feed
+    # order so the ranking is unchanged. Repeated links are fetched once; the
+    # canonical form is only the dedupe key, the feed's own link is what's fetched.
+    candidates, seen = [], set()
     for it in items:
-        if used >= MAX_ITEMS: break
-        txt = extract_text(it["link"])
+        if len(candidates) >= MAX_ITEMS * 2: break
+        key = canon_url(it["link"])
+        if key in seen: continue
+        seen.add(key)
+        candidates.append(it)
+    if not candidates:
+        return []
+    texts = extract_many([it["link"] for it in candidates])
+    notes, tokens = [], 0
+    for it, txt in zip(candidates, texts):
+        if len(notes) >= MAX_ITEMS: break
         if not txt:
             continue
         sent = first_sentence(txt)
         if len(sent.split()) < 6:
             continue
-        notes.append(f"{it['source']}: {sent}  (link: {it['link']})")
-        used += 1
+        note = f"{it['source']}: {sent}"
+        tokens += len(note) // 4 + 1   # ~4 chars/token; good enough for a budget
+        if tokens > NOTES_TOKEN_BUDGET:
+            break
+        notes.append(note)
     return notes
 
 def boston_now():
@@ -129,17 +475,27 @@ def boston_now():
     return now, tod, pretty_date
 
 # ---------- OpenAI ----------
-try:
-    from openai import OpenAI
-    _client = OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
-except Exception as e:
-    print(f"[warn] openai import failed: {e}", file=sys.stderr)
-    _client = None
-
-def _responses_api(prompt_text: str, notes: list[str], model: str) -> str:
-    """Use Responses API for gpt-5* models — NO temperature here to avoid 400s."""
+_client = None
+
+def _openai():
+    """OpenAI client, created on first use (the SDK is slow to import) and then reused."""
+    global _client
+    if _client is None and OPENAI_API_KEY:
+        try:
+            from openai import OpenAI, Timeout
+        except Exception as e:
+            print(f"[warn] openai import failed: {e}", file=sys.stderr)
+            return None
+        # retries are handled by with_backoff, so the SDK's own retry loop is off; a short
+        # connect timeout lets a dead connection fail fast into that loop (the read timeout
+        # is per chunk while streaming, so it only has to outlast a reasoning pause)
+        _client = OpenAI(api_key=OPENAI_API_KEY, max_retries=0,
+                         timeout=Timeout(120.0, connect=5.0))
+    return _client
+
+def _control_block() -> str:
     now, tod, pretty_date = boston_now()
-    control = (
+    return (
         "HARD CONSTRAINTS (do not violate):\n"
         f"- Time-of-day greeting MUST be: 'Good {tod}, it’s {pretty_date}.'\n"
         "- Lead with the most important news; do NOT lead with sports unless it is indisputably the top story.\n"
@@ -147,64 +503,164 @@ def _responses_api(prompt_text: str, notes: list[str], model: str) -> str:
         "- Integrate source names naturally in the sentence (e.g., 'The Globe reports…', 'Boston.com says…', 'B-Side notes…').\n"
         "- 5–8 items; smooth transitions; end with quick weather + notable events, then the disclosure.\n"
     )
-    user_block = "STORIES (verbatim notes, may be messy):\n" + "\n\n".join(notes)
-    full_input = f"{control}\n\nUSER PROMPT:\n{prompt_text.strip()}\n\n{user_block}"
 
-    resp = _client.responses.create(
-        model=model,
-        input=full_input,
+def _responses_body(prompt_text: str, notes: list[str], model: str) -> dict:
+    """Responses API request for gpt-5* models — NO temperature here to avoid 400s."""
+    user_block = "STORIES:\n" + "\n".join(notes)
+    full_input = f"{_control_block()}\n\nUSER PROMPT:\n{prompt_text.strip()}\n\n{user_block}"
+    return {
+        "model": model,
+        "input": full_input,
         # temperature intentionally omitted for compatibility
-        max_output_tokens=2000,
-    )
-    return (getattr(resp, "output_text", None) or "").strip()
+        "max_output_tokens": 2000,
+    }
 
-def _chat_api(prompt_text: str, notes: list[str], model: str) -> str:
-    """Use Chat Completions for gpt-4* (supports temperature/max_tokens)."""
-    now, tod, pretty_date = boston_now()
-    control = (
-        "HARD CONSTRAINTS (do not violate):\n"
-        f"- Time-of-day greeting MUST be: 'Good {tod}, it’s {pretty_date}.'\n"
-        "- Lead with the most important news; do NOT lead with sports unless it is indisputably the top story.\n"
-        "- Absolutely no editorializing, sympathy, or sentiment (no 'thoughts and prayers', 'we hope', etc.).\n"
-        "- Integrate source names naturally in the sentence (e.g., 'The Globe reports…', 'Boston.com says…', 'B-Side notes…').\n"
-        "- 5–8 items; smooth transitions; end with quick weather + notable events, then the disclosure.\n"
-    )
-    user_block = "STORIES (verbatim notes, may be messy):\n" + "\n\n".join(notes)
-    resp = _client.chat.completions.create(
-        model=model,
-        messages=[
-            {"role":"system","content":control},
+def _chat_body(prompt_text: str, notes: list[str], model: str) -> dict:
+    """Chat Completions request for gpt-4* (supports temperature/max_tokens)."""
+    user_block = "STORIES:\n" + "\n".join(notes)
+    return {
+        "model": model,
+        "messages": [
+            {"role":"system","content":_control_block()},
             {"role":"user","content":f"{prompt_text.strip()}\n\n{user_block}"},
         ],
-        temperature=0.65,    # a little more life, still factual
-        max_tokens=2000,     # give it headroom
-        presence_penalty=0.15,
-        frequency_penalty=0.35,
-    )
-    return resp.choices[0].message.content.strip()
+        "temperature": 0.65,    # a little more life, still factual
+        "max_tokens": 2000,     # give it headroom
+        "presence_penalty": 0.15,
+        "frequency_penalty": 0.35,
+    }
 
-def rewrite_with_openai(prompt_text: str, notes: list[str]) -> str | None:
-    if not _client or not OPENAI_MODEL:
-        return None
+def _collect(deltas, on_paragraph=None) -> str:
+    """Join streamed text deltas, handing each finished paragraph to `on_paragraph`."""
+    parts, pending = [], ""
+    for delta in deltas:
+        parts.append(delta)
+        if on_paragraph:
+            pending += delta
+            while "\n\n" in pending:
+                para, pending = pending.split("\n\n", 1)
+                if para.strip():
+                    on_paragraph(para.strip())
+    if on_paragraph and pending.strip():
+        on_paragraph(pending.strip())
+    return "".join(parts).strip()
+
+@with_backoff
+def _responses_api(prompt_text: str, notes: list[str], model: str, on_paragraph=None) -> str:
+    """Stream the draft; each finished paragraph is handed to `on_paragraph` right away."""
+    stream = _openai().responses.create(**_responses_body(prompt_text, notes, model), stream=True)
+
+    def deltas():
+        for event in stream:
+            if event.type == "response.output_text.delta":
+                yield event.delta
+            elif event.type in ("response.failed", "error"):
+                raise RuntimeError(f"Responses stream ended with {event.type}")
+    return _collect(deltas(), on_paragraph)
+
+@with_backoff
+def _chat_api(prompt_text: str, notes: list[str], model: str, on_paragraph=None) -> str:
+    """Same as _responses_api, for Chat Completions models."""
+    stream = _openai().chat.completions.create(**_chat_body(prompt_text, notes, model), stream=True)
+    return _collect((chunk.choices[0].delta.content or "" for chunk in stream if chunk.choices),
+                    on_paragraph)
+
+def _batch_api(prompt_text: str, notes: list[str], model: str) -> str:
+    """Run the draft through the Batch API (half the token price; the cron can wait)."""
+    if model.lower().startswith("gpt-5"):
+        endpoint, body = "/v1/responses", _responses_body(prompt_text, notes, model)
+    else:
+        endpoint, body = "/v1/chat/completions", _chat_body(prompt_text, notes, model)
+    line = json.dumps({"custom_id": "daily", "method": "POST", "url": endpoint, "body": body})
+    client = _openai()
+    upload = client.files.create(file=("daily.jsonl", line.encode("utf-8")), purpose="batch")
+    batch = client.batches.create(input_file_id=upload.id, endpoint=endpoint, completion_window="24h")
+    deadline = time.monotonic() + BATCH_MAX_WAIT
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        if time.monotonic() > deadline:
+            client.batches.cancel(batch.id)
+            raise TimeoutError(f"batch {batch.id} still {batch.status} after {BATCH_MAX_WAIT}s")
+        time.sleep(BATCH_POLL_SECS)
+        batch = client.batches.retrieve(batch.id)
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"batch {batch.id} ended with status {batch.status}")
+    result = json.loads(client.files.content(batch.output_file_id).text.splitlines()[0])
+    if result.get("error"):
+        raise RuntimeError(f"batch {batch.id} request failed: {result['error']}")
+    out = result["response"]["body"]
+    if endpoint == "/v1/chat/completions":
+        return out["choices"][0]["message"]["content"].strip()
+    return "".join(
+        c.get("text", "")
+        for item in out.get("output", []) if item.get("type") == "message"
+        for c in item.get("content", []) if c.get("type") == "output_text"
+    ).strip()
+
+def _draft(prompt_text: str, notes: list[str], on_paragraph=None) -> str | None:
     try:
+        if USE_BATCH:
+            return _batch_api(prompt_text, notes, OPENAI_MODEL)
         if OPENAI_MODEL.lower().startswith("gpt-5"):
-            return _responses_api(prompt_text, notes, OPENAI_MODEL)
+            return _responses_api(prompt_text, notes, OPENAI_MODEL, on_paragraph)
         else:
-            return _chat_api(prompt_text, notes, OPENAI_MODEL)
+            return _chat_api(prompt_text, notes, OPENAI_MODEL, on_paragraph)
     except Exception as e:
         print(f"[warn] OpenAI error: {e}", file=sys.stderr)
         # Fallback to gpt-4o so runs still succeed
         try:
-            return _chat_api(prompt_text, notes, "gpt-4o")
+            return _chat_api(prompt_text, notes, "gpt-4o", on_paragraph)
         except Exception as e2:
             print(f"[warn] OpenAI fallback failed: {e2}", file=sys.stderr)
             return None
 
-# ---------- ElevenLabs (kept compatible) ----------
-def tts_elevenlabs(text: str) -> bytes | None:
-    if not ELEVEN_API_KEY or not ELEVEN_VOICE_ID or not text.strip():
+def rewrite_with_openai(prompt_text: str, notes: list[str], on_paragraph=None) -> str | None:
+    """Draft the script. `on_paragraph` (optional) sees paragraphs as they stream in.
+
+    Identical requests (same model, constraints, prompt and notes) are served from
+    disk, so a re-run after a later failure doesn't pay for the draft twice.
+    """
+    if not OPENAI_MODEL or _openai() is None:
         return None
-    url = f"https://api.elevenlabs.io/v1/text-to-speech/{ELEVEN_VOICE_ID}"
+    # the hour is part of the key: the control block only carries the date and time-of-day
+    # bucket, so hourly runs on unchanged notes would otherwise all replay one draft
+    hour = boston_now()[0].strftime("%Y-%m-%d %H")
+    key = "\0".join([OPENAI_MODEL, hour, _control_block(), prompt_text.strip(), *notes])
+    cache_path = DRAFT_CACHE / f"{hashlib.sha256(key.encode()).hexdigest()}.txt"
+    try:
+        return cache_path.read_text(encoding="utf-8")
+    except OSError:
+        pass
+    script = _draft(prompt_text, notes, on_paragraph)
+    if script:
+        try:
+            _write_atomic(cache_path, script)
+        except OSError as ex:
+            print(f"[warn] draft cache write failed: {ex}", file=sys.stderr)
+    return script
+
+# ---------- ElevenLabs (kept compatible) ----------
+def split_segments(text: str) -> list[str]:
+    """Split a script on blank lines, merging short paragraphs into TTS-sized segments."""
+    segments, cur = [], ""
+    for para in re.split(r"\n\s*\n", text.strip()):
+        para = para.strip()
+        if not para:
+            continue
+        cur = f"{cur}\n\n{para}" if cur else para
+        if len(cur) >= TTS_MIN_CHARS:
+            segments.append(cur)
+            cur = ""
+    if cur:
+        # a short tail rides along with the previous segment
+        if segments and len(cur) < TTS_MIN_CHARS:
+            segments[-1] = f"{segments[-1]}\n\n{cur}"
+        else:
+            segments.append(cur)
+    return segments
+
+@with_backoff
+def _tts_request(text: str, dest: Path, previous_text: str | None = None, next_text: str | None = None):
+    url = f"https://api.elevenlabs.io/v1/text-to-speech/{ELEVEN_VOICE_ID}/stream"
     payload = {
         "text": text,
         "voice_settings": {
@@ -216,38 +672,159 @@ def tts_elevenlabs(text: str) -> bytes | None:
         "voice_speed": 1.05,           # mild pace-up to avoid rushy catch-ups
         "model_id": "eleven_multilingual_v2"
     }
+    # neighbouring text keeps intonation continuous across separately rendered segments
+    if previous_text:
+        payload["previous_text"] = previous_text
+    if next_text:
+        payload["next_text"] = next_text
     headers = {
         "xi-api-key": ELEVEN_API_KEY,
         "accept": "audio/mpeg",
-        "content-type": "application/json"
     }
-    r = requests.post(url, headers=headers, data=json.dumps(payload), timeout=120)
-    r.raise_for_status()
-    return r.content
+    # /stream returns audio while it is being synthesized; write it to disk in
+    # 64 KB chunks instead of holding the whole MP3 in memory.
+    with SESSION.post(url, headers=headers, params={"output_format": "mp3_44100_128"},
+                      json=payload, timeout=120, stream=True) as r:
+        r.raise_for_status()
+        with open(dest, "wb") as f:
+            for chunk in r.iter_content(chunk_size=64 * 1024):
+                f.write(chunk)
+
+def _part_path(ep_path: Path, i: int) -> Path:
+    return ep_path.with_name(f"{ep_path.stem}.part{i}{ep_path.suffix}")
+
+def _concat_parts(parts: list[Path], ep_path: Path):
+    # MP3 frames are self-contained, so segments can simply be appended in order.
+    with open(ep_path, "wb") as out:
+        for part in parts:
+            with open(part, "rb") as f:
+                shutil.copyfileobj(f, out, 64 * 1024)
+
+def tts_elevenlabs(text: str, ep_path: Path) -> int | None:
+    """Synthesize `text` straight into `ep_path`; returns the file size in bytes."""
+    if not ELEVEN_API_KEY or not ELEVEN_VOICE_ID or not text.strip():
+        return None
+    segments = split_segments(text)
+    if len(segments) == 1:
+        _tts_request(segments[0], ep_path)
+        return os.path.getsize(ep_path)
+    # Synthesis time grows with text length, so render paragraphs side by side.
+    parts = [_part_path(ep_path, i) for i in range(len(segments))]
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, TTS_WORKERS)) as ex:
+            list(ex.map(_tts_request, segments, parts, [None] + segments[:-1], segments[1:] + [None]))
+        _concat_parts(parts, ep_path)
+    finally:
+        for part in parts:
+            part.unlink(missing_ok=True)
+    return os.path.getsize(ep_path)
+
+# ---------- Pipeline ----------
+def draft_and_speak(prompt_text: str, notes: list[str], ep_path: Path) -> tuple[str | None, int | None]:
+    """Draft the script and start TTS on each paragraph while the rest is still streaming.
+
+    Returns (script, filesize). If the audio would not match the final script
+    (e.g. the OpenAI fallback kicked in mid-stream) it is re-rendered from scratch.
+    """
+    if not ELEVEN_API_KEY or not ELEVEN_VOICE_ID:
+        return rewrite_with_openai(prompt_text, notes), None
+    spoken, jobs, cur, held, prev = [], [], "", None, None
+    ex = ThreadPoolExecutor(max_workers=max(1, TTS_WORKERS))
+
+    def submit(text, next_text=None):
+        nonlocal prev
+        part = _part_path(ep_path, len(jobs))
+        jobs.append((part, ex.submit(_tts_request, text, part, prev, next_text)))
+        prev = text
+
+    def on_paragraph(para):
+        nonlocal cur, held
+        spoken.append(para)
+        cur = f"{cur}\n\n{para}" if cur else para
+        if len(cur) >= TTS_MIN_CHARS:
+            # hold the newest full segment back so a short tail can still join it, the
+            # way split_segments does; the held one goes out once its successor is known
+            if held:
+                submit(held, cur)
+            held, cur = cur, ""
+
+    try:
+        script = rewrite_with_openai(prompt_text, notes, on_paragraph=on_paragraph)
+        if not script:
+            return None, None
+        if " ".join(script.split()) != " ".join(" ".join(spoken).split()):
+            ex.shutdown(cancel_futures=True)
+            return script, tts_elevenlabs(script, ep_path)
+        if held and cur:
+            submit(f"{held}\n\n{cur}")
+        elif held or cur:
+            submit(held or cur)
+        for _, fut in jobs:
+            fut.result()
+        _concat_parts([part for part, _ in jobs], ep_path)
+        return script, os.path.getsize(ep_path)
+    finally:
+        ex.shutdown(wait=True, cancel_futures=True)
+        for part, _ in jobs:
+            part.unlink(missing_ok=True)
 
 # ---------- Output ----------
+SHOWNOTES_TMPL = """<html><head><meta charset='utf-8'><title>Boston Briefing – Sources</title></head><body>
+<h2>Boston Briefing – {date}</h2>
+<ol>
+{items}
+</ol></body></html>"""
+SHOWNOTES_ITEM = "<li><a href='{link}' target='_blank' rel='noopener'>{title}</a> – {source}</li>"
+
+INDEX_TMPL = """<html><head><meta charset='utf-8'><title>Boston Briefing</title></head>
+<body>
+  <h1>Boston Briefing</h1>
+  <p>Podcast RSS: <a href="{feed_url}">{feed_url}</a></p>
+  <p>Shownotes: <a href="{shownotes_base}/shownotes/">Open folder</a></p>
+</body></html>
+"""
+
+def _write_page(path: Path, text: str):
+    """Encode once and hand the bytes to os.write, skipping the buffered text layer."""
+    data = memoryview(text.encode("utf-8"))
+    # O_BINARY (Windows only): otherwise the CRT still turns "\n" into "\r\n" in os.write
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+# PUBLIC_BASE_URL is fixed for the process, so the index links are built (and escaped) once
+_PUB_BASE       = PUBLIC_BASE_URL.rstrip("/")
+_FEED_URL       = escape(f"{_PUB_BASE}/feed.xml" if _PUB_BASE else "feed.xml")
+_SHOWNOTES_BASE = escape(_PUB_BASE or ".")
+INDEX_PAGE      = PUBLIC_DIR / "index.html"
+
 def write_shownotes(date_str, items):
-    html = ["<html><head><meta charset='utf-8'><title>Boston Briefing – Sources</title></head><body>"]
-    html.append(f"<h2>Boston Briefing – {date_str}</h2>")
-    html.append("<ol>")
-    take = 0
-    for it in items:
-        if take >= MAX_ITEMS: break
-        html.append(f"<li><a href='{it['link']}' target='_blank' rel='noopener'>{it['title']}</a> – {it['source']}</li>")
-        take += 1
-    html.append("</ol></body></html>")
-    (SH_NOTES / f"{date_str}.html").write_text("\n".join(html), encoding="utf-8")
+    # escape each field once up front; the row loop then only unpacks tuples
+    rows = [(escape(it["link"]), escape(it["title"]), escape(it["source"]))
+            for it in islice(items, MAX_ITEMS)]
+    if not rows:
+        return   # don't replace a page with an empty list
+    # join() materializes its input anyway, so hand it a list rather than a generator
+    lis = "\n".join([SHOWNOTES_ITEM.format(link=link, title=title, source=source)
+                      for link, title, source in rows])
+    rendered = SHOWNOTES_TMPL.format(date=escape(date_str), items=lis)
+    path = SH_NOTES / f"{date_str}.html"
+    # identical page already on disk (same date, same stories): leave its mtime alone
+    sig = hashlib.blake2b(rendered.encode("utf-8"), digest_size=16).hexdigest()
+    try:
+        if path.exists() and SHOWNOTES_SIG.read_text(encoding="utf-8") == sig:
+            return
+    except OSError:
+        pass
+    _write_page(path, rendered)
+    try:
+        SHOWNOTES_SIG.write_text(sig, encoding="utf-8")
+    except OSError as ex:
+        print(f"[warn] shownotes sig write failed: {ex}", file=sys.stderr)
 
 def write_index():
-    url = f"{PUBLIC_BASE_URL}/feed.xml" if PUBLIC_BASE_URL else "feed.xml"
-    shownotes_base = (PUBLIC_BASE_URL or ".").rstrip("/")
-    lines = [
-        "<html><head><meta charset='utf-8'><title>Boston Briefing</title></head>",
-        "<body>",
-        "  <h1>Boston Briefing</h1>",
-        f'  <p>Podcast RSS: <a href="{url}">{url}</a></p>',
-        f'  <p>Shownotes: <a href="{shownotes_base}/shownotes/">Open folder</a></p>',
-        "</body></html>",
-        "",
-    ]
-    (PUBLIC_DIR / "index.html").write_text("\n".join(lines), encoding="utf-8")
+    rendered = INDEX_TMPL.format(feed_url=_FEED_URL, shownotes_base=_SHOWNOTES_BASE)
+    _write_page(INDEX_PAGE, rendered)